@@ -1,16 +1,23 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
 import re
-from datetime import datetime, timedelta
-import time
-import json
-from urllib.parse import urljoin, urlparse
-import openai
-from typing import Dict, List, Optional
-import plotly.express as px
-import plotly.graph_objects as go
+import asyncio
+import ahocorasick
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+# plotly and openai are imported where they're used so first paint doesn't wait on them
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from openai import AsyncOpenAI
 
 # Configure page
 st.set_page_config(
@@ -21,104 +28,292 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        text-align: center;
-        padding: 2rem 0;
-        background: linear-gradient(90deg, #1f4e79 0%, #2d5aa0 100%);
-        color: white;
-        border-radius: 10px;
-        margin-bottom: 2rem;
+@st.cache_resource
+def _load_css() -> str:
+    """Read the stylesheet once per server process instead of on every rerun"""
+    return (Path(__file__).parent / 'style.css').read_text()
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
+
+# Patterns used on every scraped page, compiled once at import
+_RE_COPYRIGHT = re.compile(r'(?:copyright|©)[^0-9]{0,40}(\d{4})', re.I)
+_RE_DATES = [re.compile(p, re.I) for p in (
+    r'last updated:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'updated:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'(\d{1,2}/\d{1,2}/\d{4})'
+)]
+
+# Case-insensitive href selectors; select_one stops at the first matching link
+_SEL_BLOG = soupsieve.compile(
+    'a[href*="blog" i], a[href*="news" i], link[href*="blog" i], link[href*="news" i]'
+)
+_SEL_CAREERS = soupsieve.compile(
+    'a[href*="career" i], a[href*="job" i], a[href*="hiring" i], '
+    'link[href*="career" i], link[href*="job" i], link[href*="hiring" i]'
+)
+
+# Succession signals (title, copyright, links) sit near the top of the page,
+# so stop downloading after this many decoded bytes
+MAX_PAGE_BYTES = 512 * 1024
+
+# Industries and regions that score higher for succession readiness
+HIGH_SUCCESSION_INDUSTRIES = [
+    'construction', 'manufacturing', 'automotive', 'plumbing', 
+    'electrical', 'hvac', 'roofing', 'landscaping', 'trucking'
+]
+TARGET_STATES = ['va', 'virginia', 'co', 'colorado', 'tn', 'tennessee']
+
+# Sidebar region choices; locations usually end in the abbreviation
+REGION_ABBREVIATIONS = {
+    'Virginia': 'VA',
+    'Colorado': 'CO',
+    'Tennessee': 'TN',
+    'North Carolina': 'NC',
+    'Alabama': 'AL'
+}
+
+def _build_automaton(keywords: List[str], bump: int) -> ahocorasick.Automaton:
+    """Single-pass substring matcher over keywords, each carrying its score bump"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, (bump, keyword))
+    automaton.make_automaton()
+    return automaton
+
+_INDUSTRY_AUTOMATON = _build_automaton(HIGH_SUCCESSION_INDUSTRIES, 15)
+_REGION_AUTOMATON = _build_automaton(TARGET_STATES, 10)
+
+# Uploads larger than this are read in chunks behind a progress bar
+_CSV_CHUNKED_BYTES = 50 * 1024 * 1024
+_CSV_CHUNK_ROWS = 100_000
+
+# AI summaries are written against this stand-in and the real name substituted
+# afterwards, so businesses with matching signals can share one completion
+_SUMMARY_NAME_PLACEHOLDER = '[BUSINESS]'
+_SUMMARY_CACHE_SIZE = 1024
+
+# Invariant instructions go in the system message; each call sends only the fields
+_SUMMARY_SYSTEM_PROMPT = (
+    "You brief business development professionals before a respectful call about "
+    "succession planning. Input is 'business|industry|region|approximate score/100|key factors'. "
+    "Reply with a warm, conversational 2-3 sentence summary that is specific about "
+    f"the succession signals. Refer to the business exactly as {_SUMMARY_NAME_PLACEHOLDER}."
+)
+
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+@st.cache_resource
+def _http_session() -> requests.Session:
+    """Pooled session shared across reruns so DNS/TCP/TLS setup is reused"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def _latest_copyright(text: str) -> Optional[int]:
+    """Latest plausible copyright year mentioned in text, or None"""
+    current_year = datetime.now().year
+    latest = None
+    for match in _RE_COPYRIGHT.finditer(text):
+        year = int(match.group(1))
+        if 1990 <= year <= current_year and (latest is None or year > latest):
+            latest = year
+            # Nothing can beat the current year
+            if year == current_year:
+                break
+    return latest
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _scrape_website_data(url: str) -> Dict:
+    """Scrape basic website data; raises on failure so errors are never cached"""
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    
+    with _http_session().get(url, headers=_REQUEST_HEADERS, timeout=(3, 7), stream=True) as response:
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_PAGE_BYTES:
+                break
+    content = b''.join(chunks)[:MAX_PAGE_BYTES]
+    
+    soup = BeautifulSoup(content, 'lxml')
+    
+    # Extract basic info
+    title = soup.find('title')
+    title_text = title.text.strip() if title else ""
+    
+    # Look for the latest copyright year, preferring the footer where they live;
+    # the first <footer> may belong to an article or card, so fall back to the page
+    text_content = soup.get_text()
+    footer = soup.find('footer')
+    latest_copyright = _latest_copyright(footer.get_text()) if footer else None
+    if latest_copyright is None:
+        latest_copyright = _latest_copyright(text_content)
+    
+    # Check for blog/news sections
+    has_blog = _SEL_BLOG.select_one(soup) is not None
+    
+    # Check for careers/hiring pages
+    has_careers = _SEL_CAREERS.select_one(soup) is not None
+    
+    # Look for last updated dates
+    last_updated = None
+    for pattern in _RE_DATES:
+        matches = pattern.findall(text_content)
+        if matches:
+            try:
+                last_updated = datetime.strptime(matches[0], '%m/%d/%Y')
+                break
+            except:
+                continue
+    
+    return {
+        'accessible': True,
+        'title': title_text,
+        'latest_copyright': latest_copyright,
+        'has_blog': has_blog,
+        'has_careers': has_careers,
+        'last_updated': last_updated,
+        'text_length': len(text_content)
     }
-    .metric-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        border-left: 4px solid #1f4e79;
+
+def _lowercase(value) -> str:
+    """Lowercased text field; missing or non-text values become ''"""
+    return value.lower() if isinstance(value, str) else ''
+
+def _region_of(location_lc: str) -> str:
+    """Region part of a lowercased 'City, ST' location"""
+    return location_lc.rsplit(',', 1)[-1].strip()
+
+def _normalize_business(business: Dict) -> Dict:
+    """Precompute the lowercased fields the scorers match on, once at ingest"""
+    business['_industry_lc'] = _lowercase(business.get('industry'))
+    business['_location_lc'] = _lowercase(business.get('location'))
+    business['_region'] = _region_of(business['_location_lc'])
+    return business
+
+def _lowercased(business: Dict, field: str) -> str:
+    """Precomputed lowercased field, computed on the fly for rows missing it"""
+    value = business.get(f'_{field}_lc')
+    return value if value is not None else _lowercase(business.get(field))
+
+def _business_region(business: Dict) -> str:
+    """Precomputed region, derived on the fly for rows missing it"""
+    value = business.get('_region')
+    return value if value is not None else _region_of(_lowercased(business, 'location'))
+
+def _score_business(business_data: Dict) -> Dict:
+    """Calculate succession readiness score based on various factors"""
+    score = 0
+    factors = []
+    
+    current_year = datetime.now().year
+    
+    # Age of business (higher score for older businesses)
+    if business_data.get('founded_year'):
+        age = current_year - business_data['founded_year']
+        if age >= 20:
+            score += 25
+            factors.append(f"Established business ({age} years)")
+        elif age >= 10:
+            score += 15
+            factors.append(f"Mature business ({age} years)")
+    
+    # Website analysis
+    website_data = business_data.get('website_data', {})
+    
+    if not website_data.get('accessible'):
+        score += 20
+        factors.append("Website inaccessible/outdated")
+    else:
+        # Old copyright dates
+        latest_copyright = website_data.get('latest_copyright')
+        if latest_copyright and current_year - latest_copyright >= 3:
+            score += 15
+            factors.append(f"Copyright last updated {latest_copyright}")
+        
+        # No recent blog/news activity
+        if not website_data.get('has_blog'):
+            score += 10
+            factors.append("No blog/news section")
+        
+        # No careers page
+        if not website_data.get('has_careers'):
+            score += 10
+            factors.append("No careers/hiring page")
+    
+    # Industry factors (some industries have higher succession rates)
+    industry = _lowercased(business_data, 'industry')
+    for _, (bump, _keyword) in _INDUSTRY_AUTOMATON.iter(industry):
+        score += bump
+        factors.append(f"High-succession industry ({industry})")
+        break
+    
+    # Revenue range (sweet spot for succession)
+    revenue = business_data.get('estimated_revenue', 0)
+    if 2000000 <= revenue <= 10000000:
+        score += 20
+        factors.append("Target revenue range ($2M-$10M)")
+    
+    # Location factors (smaller markets often have higher succession needs)
+    location = _lowercased(business_data, 'location')
+    for _, (bump, _state) in _REGION_AUTOMATON.iter(location):
+        score += bump
+        factors.append("Target geographic region")
+        break
+    
+    # Normalize score to 0-100
+    max_possible_score = 115
+    normalized_score = min(100, (score / max_possible_score) * 100)
+    
+    # Categorize score
+    if normalized_score >= 70:
+        category = "High"
+        priority = "🔴"
+    elif normalized_score >= 40:
+        category = "Medium"
+        priority = "🟡"
+    else:
+        category = "Low"
+        priority = "🟢"
+    
+    return {
+        'score': round(normalized_score, 1),
+        'category': category,
+        'priority': priority,
+        'factors': factors,
+        'raw_score': score
     }
-    .high-score { border-left-color: #dc3545; }
-    .medium-score { border-left-color: #ffc107; }
-    .low-score { border-left-color: #28a745; }
-</style>
-""", unsafe_allow_html=True)
 
 class SuccessionSignal:
     def __init__(self):
         self.openai_api_key = None
+        self.summary_cache = {}
         
     def set_openai_key(self, api_key: str):
         """Set OpenAI API key"""
         self.openai_api_key = api_key
-        openai.api_key = api_key
     
     def scrape_website_data(self, url: str) -> Dict:
         """Scrape basic website data to assess digital activity"""
         try:
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract basic info
-            title = soup.find('title')
-            title_text = title.text.strip() if title else ""
-            
-            # Look for copyright dates
-            copyright_years = []
-            text_content = soup.get_text().lower()
-            copyright_matches = re.findall(r'copyright.*?(\d{4})', text_content)
-            copyright_matches.extend(re.findall(r'©.*?(\d{4})', text_content))
-            
-            if copyright_matches:
-                copyright_years = [int(year) for year in copyright_matches if 1990 <= int(year) <= 2024]
-            
-            # Check for blog/news sections
-            has_blog = bool(soup.find(['a', 'link'], href=re.compile(r'blog|news', re.I)))
-            
-            # Check for careers/hiring pages
-            has_careers = bool(soup.find(['a', 'link'], href=re.compile(r'career|job|hiring', re.I)))
-            
-            # Look for last updated dates
-            last_updated = None
-            date_patterns = [
-                r'last updated:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-                r'updated:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-                r'(\d{1,2}/\d{1,2}/\d{4})'
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, text_content, re.I)
-                if matches:
-                    try:
-                        last_updated = datetime.strptime(matches[0], '%m/%d/%Y')
-                        break
-                    except:
-                        continue
-            
-            return {
-                'accessible': True,
-                'title': title_text,
-                'copyright_years': copyright_years,
-                'latest_copyright': max(copyright_years) if copyright_years else None,
-                'has_blog': has_blog,
-                'has_careers': has_careers,
-                'last_updated': last_updated,
-                'text_length': len(text_content)
-            }
-            
+            return _scrape_website_data(url)
         except Exception as e:
             return {
                 'accessible': False,
                 'error': str(e),
                 'title': '',
-                'copyright_years': [],
                 'latest_copyright': None,
                 'has_blog': False,
                 'has_careers': False,
@@ -128,124 +323,182 @@ class SuccessionSignal:
     
     def calculate_succession_score(self, business_data: Dict) -> Dict:
         """Calculate succession readiness score based on various factors"""
-        score = 0
-        factors = []
-        
-        current_year = datetime.now().year
-        
-        # Age of business (higher score for older businesses)
-        if business_data.get('founded_year'):
-            age = current_year - business_data['founded_year']
-            if age >= 20:
-                score += 25
-                factors.append(f"Established business ({age} years)")
-            elif age >= 10:
-                score += 15
-                factors.append(f"Mature business ({age} years)")
+        return _score_business(business_data)
+    
+    def calculate_succession_scores(self, businesses: List[Dict]) -> List[Dict]:
+        """Score a batch of businesses"""
+        return [_score_business(b) for b in businesses]
+    
+    def generate_ai_summary(self, business_data: Dict, succession_data: Dict) -> str:
+        """Generate AI-powered outreach summary"""
+        return self.generate_ai_summaries([(business_data, succession_data)])[0]
+    
+    def _summary_key(self, business_data: Dict, succession_data: Dict) -> tuple:
+        """Normalized prompt fields; businesses sharing a key share a summary"""
+        return (
+            _lowercased(business_data, 'industry'),
+            _business_region(business_data),
+            round(succession_data['score'] / 10) * 10,
+            tuple(sorted(succession_data['factors'][:3]))
+        )
+    
+    def generate_ai_summaries(self, pairs: List[tuple]) -> List[str]:
+        """Generate outreach summaries for (business, succession) pairs concurrently"""
+        if not self.openai_api_key:
+            return ["AI summary requires OpenAI API key"] * len(pairs)
         
-        # Website analysis
-        website_data = business_data.get('website_data', {})
+        keys = [self._summary_key(business_data, succession_data) for business_data, succession_data in pairs]
+        missing = list(dict.fromkeys(key for key in keys if key not in self.summary_cache))
+        errors = {}
         
-        if not website_data.get('accessible'):
-            score += 20
-            factors.append("Website inaccessible/outdated")
-        else:
-            # Old copyright dates
-            latest_copyright = website_data.get('latest_copyright')
-            if latest_copyright and current_year - latest_copyright >= 3:
-                score += 15
-                factors.append(f"Copyright last updated {latest_copyright}")
+        if missing:
+            from openai import AsyncOpenAI
             
-            # No recent blog/news activity
-            if not website_data.get('has_blog'):
-                score += 10
-                factors.append("No blog/news section")
+            async def gather_summaries():
+                # One client per batch: its connection pool is bound to this event loop
+                async with AsyncOpenAI(api_key=self.openai_api_key) as client:
+                    limit = asyncio.Semaphore(16)
+                    return await asyncio.gather(*[
+                        self.generate_ai_summary_async(client, limit, key) for key in missing
+                    ], return_exceptions=True)
             
-            # No careers page
-            if not website_data.get('has_careers'):
-                score += 10
-                factors.append("No careers/hiring page")
-        
-        # Industry factors (some industries have higher succession rates)
-        high_succession_industries = [
-            'construction', 'manufacturing', 'automotive', 'plumbing', 
-            'electrical', 'hvac', 'roofing', 'landscaping', 'trucking'
-        ]
-        
-        industry = business_data.get('industry', '').lower()
-        for high_industry in high_succession_industries:
-            if high_industry in industry:
-                score += 15
-                factors.append(f"High-succession industry ({industry})")
-                break
-        
-        # Revenue range (sweet spot for succession)
-        revenue = business_data.get('estimated_revenue', 0)
-        if 2000000 <= revenue <= 10000000:
-            score += 20
-            factors.append("Target revenue range ($2M-$10M)")
+            for key, result in zip(missing, asyncio.run(gather_summaries())):
+                if isinstance(result, Exception):
+                    errors[key] = f"AI summary unavailable: {str(result)}"
+                else:
+                    self.summary_cache[key] = result
+            
+            # Evict the oldest entries once the cache is full
+            while len(self.summary_cache) > _SUMMARY_CACHE_SIZE:
+                del self.summary_cache[next(iter(self.summary_cache))]
         
-        # Location factors (smaller markets often have higher succession needs)
-        location = business_data.get('location', '').lower()
-        if any(state in location for state in ['va', 'virginia', 'co', 'colorado', 'tn', 'tennessee']):
-            score += 10
-            factors.append("Target geographic region")
+        summaries = []
+        for (business_data, _), key in zip(pairs, keys):
+            if key in self.summary_cache:
+                name = business_data.get('name', 'Unknown')
+                summaries.append(self.summary_cache[key].replace(_SUMMARY_NAME_PLACEHOLDER, name))
+            else:
+                summaries.append(errors[key])
+        return summaries
+    
+    async def generate_ai_summary_async(self, client: 'AsyncOpenAI', limit: asyncio.Semaphore,
+                                        summary_key: tuple) -> str:
+        """Generate one outreach summary template for a normalized summary key"""
+        import openai
         
-        # Normalize score to 0-100
-        max_possible_score = 115
-        normalized_score = min(100, (score / max_possible_score) * 100)
+        industry, region, score_band, factors = summary_key
+        fields = f"{_SUMMARY_NAME_PLACEHOLDER}|{industry or 'unknown'}|{region or 'unknown'}|{score_band}/100|{','.join(factors)}"
         
-        # Categorize score
-        if normalized_score >= 70:
-            category = "High"
-            priority = "🔴"
-        elif normalized_score >= 40:
-            category = "Medium"
-            priority = "🟡"
-        else:
-            category = "Low"
-            priority = "🟢"
+        # Retry rate-limited calls with exponential backoff (1s, 2s, 4s)
+        async with limit:
+            for attempt in range(4):
+                try:
+                    response = await client.chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=[
+                            {"role": "system", "content": _SUMMARY_SYSTEM_PROMPT},
+                            {"role": "user", "content": fields}
+                        ],
+                        max_tokens=80,
+                        temperature=0.4,
+                        timeout=20
+                    )
+                    break
+                except openai.RateLimitError:
+                    if attempt == 3:
+                        raise
+                    await asyncio.sleep(2 ** attempt)
         
-        return {
-            'score': round(normalized_score, 1),
-            'category': category,
-            'priority': priority,
-            'factors': factors,
-            'raw_score': score
+        return response.choices[0].message.content.strip()
+
+def _gauge_svg(score: float) -> str:
+    """Lightweight inline SVG meter for the pipeline cards"""
+    if score >= 70:
+        color = "#dc3545"
+    elif score >= 40:
+        color = "#ffc107"
+    else:
+        color = "#28a745"
+    arc = "M10 60 A50 50 0 0 1 110 60"
+    return (
+        '<svg viewBox="0 0 120 70" width="100%" height="140" role="img" '
+        f'aria-label="Succession Score {score}">'
+        f'<path d="{arc}" fill="none" stroke="#e9ecef" stroke-width="10"/>'
+        f'<path d="{arc}" fill="none" stroke="{color}" stroke-width="10" '
+        f'pathLength="100" stroke-dasharray="{min(max(score, 0), 100)} 100"/>'
+        f'<text x="60" y="56" text-anchor="middle" font-size="18" font-weight="bold">{score}</text>'
+        '<text x="60" y="69" text-anchor="middle" font-size="7">Succession Score</text>'
+        '</svg>'
+    )
+
+def _score_gauge(score: float) -> 'go.Figure':
+    """Succession score gauge for the research deep dive"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Succession Score"},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 40], 'color': "lightgreen"},
+                {'range': [40, 70], 'color': "yellow"},
+                {'range': [70, 100], 'color': "red"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 70
+            }
         }
+    ))
+    fig.update_layout(height=200)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _score_hist(scores: tuple) -> 'go.Figure':
+    """Score distribution histogram for the current pipeline"""
+    import plotly.express as px
     
-    def generate_ai_summary(self, business_data: Dict, succession_data: Dict) -> str:
-        """Generate AI-powered outreach summary"""
-        if not self.openai_api_key:
-            return "AI summary requires OpenAI API key"
-        
-        try:
-            prompt = f"""
-            Create a warm, professional 2-3 sentence summary for a business acquisition outreach. Focus on succession readiness signals.
+    fig = px.histogram(x=list(scores), nbins=10, title="Succession Score Distribution")
+    fig.update_xaxes(title="Succession Score")
+    fig.update_yaxes(title="Number of Businesses")
+    return fig
 
-            Business: {business_data.get('name', 'Unknown')}
-            Industry: {business_data.get('industry', 'Unknown')}
-            Location: {business_data.get('location', 'Unknown')}
-            Founded: {business_data.get('founded_year', 'Unknown')}
-            Succession Score: {succession_data['score']}/100
-            Key Factors: {', '.join(succession_data['factors'][:3])}
+@st.cache_data(show_spinner=False)
+def _industry_pie(industry_counts: tuple) -> 'go.Figure':
+    """Industry breakdown pie from (industry, count) pairs"""
+    import plotly.express as px
+    
+    names = [industry for industry, _ in industry_counts]
+    values = [count for _, count in industry_counts]
+    return px.pie(values=values, names=names, title="Target Industries")
 
-            Write this as if you're briefing a business development professional who will make a respectful call about succession planning. Be specific about the signals but keep it conversational and warm.
+@st.cache_data(show_spinner=False)
+def _region_bar(region_scores: tuple) -> 'go.Figure':
+    """Average score per region bar chart from (region, average) pairs"""
+    import plotly.express as px
+    
+    fig = px.bar(x=[region for region, _ in region_scores],
+                 y=[avg for _, avg in region_scores],
+                 title="Average Succession Score by Region")
+    fig.update_xaxes(title="Region")
+    fig.update_yaxes(title="Average Score")
+    return fig
 
-            Example tone: "John runs ABC Plumbing in Denver, CO. The company has been operating for 25 years, but their website hasn't been updated since 2019 and they're not actively hiring. This suggests potential succession timing - worth a respectful conversation about future planning."
-            """
-            
-            response = openai.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=150,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content.strip()
-            
-        except Exception as e:
-            return f"AI summary unavailable: {str(e)}"
+def _records_from_frame(df: pd.DataFrame) -> List[Dict]:
+    """Convert an Arrow-backed frame to business dicts with NaN for missing values"""
+    records = df.astype(object).where(df.notna(), np.nan).to_dict('records')
+    return [_normalize_business(record) for record in records]
+
+def _parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize the database to zstd Parquet"""
+    buffer = BytesIO()
+    df.to_parquet(buffer, engine='pyarrow', compression='zstd', index=False)
+    return buffer.getvalue()
 
 def load_sample_data():
     """Load sample business data for demo"""
@@ -297,19 +550,21 @@ def load_sample_data():
         }
     ]
     
-    return sample_businesses
+    return [_normalize_business(business) for business in sample_businesses]
 
 def main():
     # Header
-    st.markdown("""
+    st.html("""
     <div class="main-header">
         <h1>🎯 Succession Signal</h1>
         <p>AI-Powered Acquisition Signal Engine for Legacy Holdings</p>
     </div>
-    """, unsafe_allow_html=True)
+    """)
     
-    # Initialize the app
-    succession_app = SuccessionSignal()
+    # Initialize the app once per session so the AI summary cache survives reruns
+    if 'succession_app' not in st.session_state:
+        st.session_state.succession_app = SuccessionSignal()
+    succession_app = st.session_state.succession_app
     
     # Sidebar configuration
     st.sidebar.header("Configuration")
@@ -317,13 +572,12 @@ def main():
     # OpenAI API Key input
     api_key = st.sidebar.text_input("OpenAI API Key", type="password", 
                                    help="Required for AI-generated summaries")
-    if api_key:
-        succession_app.set_openai_key(api_key)
+    succession_app.set_openai_key(api_key)
     
     # Region filter
     regions = st.sidebar.multiselect(
         "Target Regions",
-        ["Virginia", "Colorado", "Tennessee", "North Carolina", "Alabama"],
+        list(REGION_ABBREVIATIONS),
         default=["Virginia", "Colorado", "Tennessee"]
     )
     
@@ -344,13 +598,6 @@ def main():
         processed_businesses = []
         
         for business in st.session_state.business_data:
-            # Filter by region
-            business_region = business['location'].split(',')[-1].strip()
-            region_match = any(region.lower() in business_region.lower() for region in regions)
-            
-            if not region_match:
-                continue
-            
             # Scrape website data (in demo, we'll simulate this)
             website_data = {
                 'accessible': True,
@@ -359,23 +606,37 @@ def main():
                 'has_careers': False
             }
             business['website_data'] = website_data
+        
+        # Score every business up front, then apply the region and score filters
+        scores = succession_app.calculate_succession_scores(st.session_state.business_data)
+        
+        # Match either the state name or its abbreviation
+        region_set = {region.lower() for region in regions}
+        region_set.update(REGION_ABBREVIATIONS[region].lower() for region in regions)
+        
+        candidates = []
+        for business, succession_data in zip(st.session_state.business_data, scores):
+            # Filter by region
+            if _business_region(business) not in region_set:
+                continue
             
-            # Calculate succession score
-            succession_data = succession_app.calculate_succession_score(business)
-            
-            # Filter by minimum score
+            # Filter by minimum score before spending tokens on a summary
             if succession_data['score'] < min_score:
                 continue
             
-            # Generate AI summary
-            ai_summary = succession_app.generate_ai_summary(business, succession_data)
-            
+            candidates.append((business, succession_data))
+        
+        # Generate AI summaries concurrently; each call is network-bound
+        ai_summaries = succession_app.generate_ai_summaries(candidates)
+        
+        for i, (business, succession_data) in enumerate(candidates):
             processed_businesses.append({
                 **business,
+                '_region': _business_region(business),
                 'succession_score': succession_data['score'],
                 'succession_category': succession_data['category'],
                 'succession_factors': succession_data['factors'],
-                'ai_summary': ai_summary,
+                'ai_summary': ai_summaries[i],
                 'priority': succession_data['priority']
             })
         
@@ -416,28 +677,7 @@ def main():
                 
                 with col2:
                     # Score gauge
-                    fig = go.Figure(go.Indicator(
-                        mode = "gauge+number",
-                        value = business['succession_score'],
-                        domain = {'x': [0, 1], 'y': [0, 1]},
-                        title = {'text': "Succession Score"},
-                        gauge = {
-                            'axis': {'range': [None, 100]},
-                            'bar': {'color': "darkblue"},
-                            'steps': [
-                                {'range': [0, 40], 'color': "lightgreen"},
-                                {'range': [40, 70], 'color': "yellow"},
-                                {'range': [70, 100], 'color': "red"}
-                            ],
-                            'threshold': {
-                                'line': {'color': "red", 'width': 4},
-                                'thickness': 0.75,
-                                'value': 70
-                            }
-                        }
-                    ))
-                    fig.update_layout(height=200)
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.markdown(_gauge_svg(business['succession_score']), unsafe_allow_html=True)
                 
                 # Action buttons
                 col1, col2, col3 = st.columns(3)
@@ -450,46 +690,30 @@ def main():
                 with col3:
                     if st.button(f"Research Deep Dive", key=f"research_{business['name']}"):
                         st.info("Research task created!")
+                        fig = _score_gauge(business['succession_score'])
+                        st.plotly_chart(fig, use_container_width=True, key=f"gauge_{business['name']}")
     
     with tab2:
         st.header("Pipeline Analytics")
         
         if processed_businesses:
+            df = pd.DataFrame(processed_businesses)
+            
             # Score distribution
-            scores = [b['succession_score'] for b in processed_businesses]
-            fig1 = px.histogram(x=scores, nbins=10, title="Succession Score Distribution")
-            fig1.update_xaxis(title="Succession Score")
-            fig1.update_yaxis(title="Number of Businesses")
-            st.plotly_chart(fig1, use_container_width=True)
+            st.plotly_chart(_score_hist(tuple(df['succession_score'].tolist())), use_container_width=True)
             
             # Industry breakdown
-            industries = {}
-            for b in processed_businesses:
-                industry = b['industry']
-                if industry not in industries:
-                    industries[industry] = 0
-                industries[industry] += 1
-            
-            fig2 = px.pie(values=list(industries.values()), names=list(industries.keys()), 
-                         title="Target Industries")
-            st.plotly_chart(fig2, use_container_width=True)
+            industry_counts = df['industry'].value_counts()
+            st.plotly_chart(_industry_pie(tuple(zip(industry_counts.index, industry_counts.values.tolist()))),
+                            use_container_width=True)
             
             # Regional distribution
-            regions_data = {}
-            for b in processed_businesses:
-                region = b['location'].split(',')[-1].strip()
-                if region not in regions_data:
-                    regions_data[region] = []
-                regions_data[region].append(b['succession_score'])
-            
-            if regions_data:
-                region_names = list(regions_data.keys())
-                avg_scores = [sum(scores)/len(scores) for scores in regions_data.values()]
-                
-                fig3 = px.bar(x=region_names, y=avg_scores, title="Average Succession Score by Region")
-                fig3.update_xaxis(title="Region")
-                fig3.update_yaxis(title="Average Score")
-                st.plotly_chart(fig3, use_container_width=True)
+            # Group on the normalized region but label bars with the location's own text
+            region_text = df['location'].astype(str).str.rsplit(',', n=1).str[-1].str.strip()
+            region_avg = df.assign(_region_text=region_text).groupby('_region', sort=False).agg(
+                label=('_region_text', 'first'), score=('succession_score', 'mean'))
+            st.plotly_chart(_region_bar(tuple(zip(region_avg['label'].tolist(), region_avg['score'].tolist()))),
+                            use_container_width=True)
     
     with tab3:
         st.header("Data Management")
@@ -498,19 +722,36 @@ def main():
         uploaded_file = st.file_uploader("Upload CSV with business data", type=['csv'])
         
         if uploaded_file:
-            df = pd.read_csv(uploaded_file)
+            # Small files parse in one shot with the Arrow reader; large ones stream in chunks
+            chunked = uploaded_file.size > _CSV_CHUNKED_BYTES
+            if chunked:
+                df = pd.read_csv(uploaded_file, nrows=5, dtype_backend='pyarrow')
+            else:
+                df = pd.read_csv(uploaded_file, engine='pyarrow', dtype_backend='pyarrow')
             st.write("Preview:")
             st.dataframe(df.head())
             
             if st.button("Process Uploaded Data"):
                 # Convert DataFrame to business list
-                new_businesses = df.to_dict('records')
+                if chunked:
+                    uploaded_file.seek(0)
+                    progress = st.progress(0.0, text="Loading businesses...")
+                    new_businesses = []
+                    for chunk in pd.read_csv(uploaded_file, chunksize=_CSV_CHUNK_ROWS, dtype_backend='pyarrow'):
+                        new_businesses.extend(_records_from_frame(chunk))
+                        progress.progress(min(1.0, uploaded_file.tell() / uploaded_file.size),
+                                          text=f"Loaded {len(new_businesses):,} businesses...")
+                    progress.empty()
+                else:
+                    new_businesses = _records_from_frame(df)
                 st.session_state.business_data.extend(new_businesses)
                 st.success(f"Added {len(new_businesses)} businesses to the database!")
         
         st.subheader("Current Database")
         if st.session_state.business_data:
             df = pd.DataFrame(st.session_state.business_data)
+            # Hide the precomputed matching fields from the table and exports
+            df = df.drop(columns=[c for c in df.columns if c.startswith('_')])
             st.dataframe(df)
             
             # Export functionality
@@ -521,6 +762,25 @@ def main():
                 file_name="succession_targets.csv",
                 mime="text/csv"
             )
+            
+            # Parquet is only built on request and kept until the database grows
+            rows = len(st.session_state.business_data)
+            export = st.session_state.get('parquet_export')
+            if export is None or export[0] != rows:
+                export = None
+                if st.button("Prepare Parquet export"):
+                    try:
+                        export = (rows, _parquet_bytes(df))
+                        st.session_state.parquet_export = export
+                    except Exception as e:
+                        st.warning(f"Parquet export failed: {e}")
+            if export is not None:
+                st.download_button(
+                    label="Download as Parquet",
+                    data=export[1],
+                    file_name="succession_targets.parquet",
+                    mime="application/vnd.apache.parquet"
+                )
         
         # Manual business entry
         st.subheader("Add Business Manually")
@@ -543,7 +803,7 @@ def main():
                     'estimated_revenue': revenue,
                     'employees': employees
                 }
-                st.session_state.business_data.append(new_business)
+                st.session_state.business_data.append(_normalize_business(new_business))
                 st.success(f"Added {name} to the database!")
 
 if __name__ == "__main__":